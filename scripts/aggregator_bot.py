@@ -9,6 +9,7 @@ Usage examples (once dependencies are installed and .env is configured):
 from __future__ import annotations
 
 import argparse
+import asyncio
 import csv
 import datetime as dt
 import logging
@@ -18,6 +19,14 @@ from typing import Any, Dict, List, Optional
 
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+
+try:  # pyarrow's C++ CSV writer is preferred over DataFrame.to_csv
+    import pyarrow as pa  # type: ignore
+    import pyarrow.csv as pa_csv  # type: ignore
+except Exception:  # pragma: no cover - optional dependency handling
+    pa = None  # type: ignore
+    pa_csv = None  # type: ignore
 
 from . import scrapers
 from .parse_pdf import extract_pfe_entries_from_pdf
@@ -26,7 +35,7 @@ from .utils import (
     DATA_DIR,
     EMAILS_DIR,
     ContactInfo,
-    append_tracker_row,
+    append_tracker_rows,
     detect_default_companies_csv,
     detect_default_cv_pdf,
     detect_default_pfe_pdf,
@@ -76,13 +85,11 @@ def load_sources() -> pd.DataFrame:
 
     all_entries: List[Dict[str, Any]] = []
 
-    # Web sources
-    for url in SCRAPE_SOURCES:
-        try:
-            entries = scrapers.scrape_url(url)
-            all_entries.extend(entries)
-        except Exception as exc:  # pragma: no cover - network dependent
-            logging.warning("Error scraping %s: %s", url, exc)
+    # Web sources, fetched concurrently (I/O-bound fan-out)
+    try:
+        all_entries.extend(asyncio.run(scrapers.scrape_urls_async(SCRAPE_SOURCES)))
+    except Exception as exc:  # pragma: no cover - network dependent
+        logging.warning("Error scraping web sources: %s", exc)
 
     # PDF source
     pdf_path = detect_default_pfe_pdf()
@@ -115,36 +122,34 @@ def load_sources() -> pd.DataFrame:
     df["contact_email"] = df["contact_email"].fillna("").astype(str)
     df["source_url"] = df["source_url"].fillna("").astype(str)
     df["date_scraped"] = df["date_scraped"].fillna(dt.date.today().isoformat()).astype(str)
+
+    # Drop exact-link duplicates before fitness scoring: overlapping
+    # sources (e.g. pfebook.com vs pfebooks.com) yield the same links and
+    # scoring soon-to-be-discarded rows is wasted work. PDF entries have
+    # no link, so blank links are left alone.
+    link_key = df["link"].fillna("").astype(str).str.strip().str.lower()
+    df = df[~(link_key.ne("") & link_key.duplicated())]
     return df
 
 
 def apply_fitness(df: pd.DataFrame, companies_df: pd.DataFrame) -> pd.DataFrame:
     """Match each project with a fitness score based on company."""
 
-    fitness_vals: List[str] = []
-    match_company_vals: List[str] = []
-    approx_flags: List[bool] = []
-    scores: List[float] = []
-
-    for _, row in df.iterrows():
-        m = match_company_fitness(str(row.get("company", "")), companies_df)
-        if m is None:
-            fitness_vals.append("")
-            match_company_vals.append("")
-            approx_flags.append(False)
-            scores.append(0.0)
-        else:
-            fitness_vals.append(m.fitness)
-            match_company_vals.append(m.company_csv)
-            approx_flags.append(m.approx)
-            scores.append(m.score)
-
-    df = df.copy()
-    df["fitness"] = fitness_vals
-    df["csv_company_match"] = match_company_vals
-    df["fitness_match_approx"] = approx_flags
-    df["fitness_match_score"] = scores
-    return df
+    # Fuzzy-match only the distinct company names, then broadcast: many
+    # rows share a company, so this cuts match_company_fitness calls from
+    # O(rows) to O(distinct companies).
+    companies = df["company"].fillna("").astype(str)
+    cache = {c: match_company_fitness(c, companies_df) for c in pd.unique(companies)}
+    matches = companies.map(cache)
+
+    # assign returns a shallow-copied frame that reuses the unchanged
+    # column buffers, instead of duplicating the whole DataFrame.
+    return df.assign(
+        fitness=[m.fitness if m else "" for m in matches],
+        csv_company_match=[m.company_csv if m else "" for m in matches],
+        fitness_match_approx=[m.approx if m else False for m in matches],
+        fitness_match_score=[m.score if m else 0.0 for m in matches],
+    )
 
 
 def deduplicate(df: pd.DataFrame) -> pd.DataFrame:
@@ -156,12 +161,11 @@ def deduplicate(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         return df
 
-    df = df.copy()
-    # Create a slug project id
-    df["project_id"] = [make_project_id(t, c) for t, c in zip(df["title"], df["company"])]
-    df.sort_values("fitness_match_score", ascending=False, inplace=True)
-    df = df.drop_duplicates(subset=["title", "company"], keep="first")
-    return df
+    # Create a slug project id; assign/sort_values already yield new
+    # shallow frames, so no explicit full copy is needed.
+    df = df.assign(project_id=[make_project_id(t, c) for t, c in zip(df["title"], df["company"])])
+    df = df.sort_values("fitness_match_score", ascending=False)
+    return df.drop_duplicates(subset=["title", "company"], keep="first")
 
 
 def filter_by_fitness_and_date(
@@ -172,26 +176,16 @@ def filter_by_fitness_and_date(
     if df.empty:
         return df
 
-    df = df.copy()
+    # Boolean indexing below already produces new frames; no copy needed.
     if fitness_filter:
         df = df[df["fitness"].isin(fitness_filter)]
 
     if since:
-        # date_scraped is ISO date; we parse to datetime
-        def parse_date(value: str) -> Optional[dt.datetime]:
-            try:
-                return dt.datetime.fromisoformat(value)
-            except Exception:
-                try:
-                    return dt.datetime.strptime(value, "%Y-%m-%d")
-                except Exception:
-                    return None
-
-        mask = []
-        for v in df["date_scraped"].astype(str):
-            d = parse_date(v)
-            mask.append(d is None or d >= since)
-        df = df[mask]
+        # date_scraped is ISO date; parse the whole column at once with
+        # pandas' C parser. Unparseable dates become NaT and are kept,
+        # matching the old per-row behavior.
+        dates = pd.to_datetime(df["date_scraped"], errors="coerce")
+        df = df[dates.isna() | (dates >= pd.Timestamp(since))]
 
     return df
 
@@ -218,20 +212,17 @@ def generate_email_drafts(df: pd.DataFrame, my_info: Dict[str, str]) -> int:
     EMAILS_DIR.mkdir(parents=True, exist_ok=True)
     count = 0
     today = dt.date.today().isoformat()
-    for _, row in df.iterrows():
-        project = row.to_dict()
+    for row in df.itertuples(index=False):
+        project = row._asdict()
         body_fr = render_email(project, my_info, language="fr")
         body_en = render_email(project, my_info, language="en")
-        slug = row.get("project_id") or make_project_id(project.get("title", ""), project.get("company", ""))
+        slug = project.get("project_id") or make_project_id(project.get("title", ""), project.get("company", ""))
         filename = f"{today}_{slug}.txt"
         path = EMAILS_DIR / filename
-        with path.open("w", encoding="utf-8") as f:
-            f.write("# French version\n\n")
-            f.write(body_fr)
-            f.write("\n\n# English version\n\n")
-            f.write(body_en)
+        content = f"# French version\n\n{body_fr}\n\n# English version\n\n{body_en}"
+        path.write_text(content, encoding="utf-8")
         # mark in tracker
-        update_tracker_field(str(row.get("project_id", slug)), "email_draft", filename)
+        update_tracker_field(str(project.get("project_id") or slug), "email_draft", filename)
         count += 1
     return count
 
@@ -246,19 +237,24 @@ def post_to_telegram(df: pd.DataFrame) -> int:
     base_url = f"https://api.telegram.org/bot{token}/sendMessage"
     count = 0
     tracker_index = load_tracker_index()
-    for _, row in df.iterrows():
-        pid = str(row.get("project_id") or "")
+    # One pooled session for the whole batch: keep-alive amortizes the
+    # TCP+TLS handshake across posts instead of paying it per message.
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+    for row in df.itertuples(index=False):
+        project = row._asdict()
+        pid = str(project.get("project_id") or "")
         # Skip if already posted
         if pid and pid in tracker_index:
             posted_before = tracker_index[pid].get("posted_telegram", "").strip().lower()
             if posted_before in {"1", "true", "yes", "y"}:
                 continue
-        text = f"PFE: {row['title']} — {row['company'] or 'N/A'}\nFitness: {row['fitness'] or 'N/A'}"\
-            f"{' (approx company match)' if row.get('fitness_match_approx') else ''}\n"\
-            f"Link: {row['link'] or row['source_url']}"
+        text = f"PFE: {project['title']} — {project['company'] or 'N/A'}\nFitness: {project['fitness'] or 'N/A'}"\
+            f"{' (approx company match)' if project.get('fitness_match_approx') else ''}\n"\
+            f"Link: {project['link'] or project['source_url']}"
         payload = {"chat_id": chat_id, "text": text}
         try:
-            resp = requests.post(base_url, json=payload, timeout=15)
+            resp = session.post(base_url, json=payload, timeout=15)
             if resp.status_code >= 400:
                 logging.warning("Telegram API error %s: %s", resp.status_code, resp.text)
             else:
@@ -278,20 +274,25 @@ def create_github_issues(df: pd.DataFrame) -> int:
         return 0
 
     base_url = f"https://api.github.com/repos/{repo}/issues"
-    headers = {"Authorization": f"token {token}", "Accept": "application/vnd.github+json"}
     count = 0
     tracker_index = load_tracker_index()
-    for _, row in df.iterrows():
-        pid = str(row.get("project_id") or "")
+    # Pooled session with default headers; keep-alive spares one TLS
+    # handshake per issue against api.github.com.
+    session = requests.Session()
+    session.headers.update({"Authorization": f"token {token}", "Accept": "application/vnd.github+json"})
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+    for row in df.itertuples(index=False):
+        project = row._asdict()
+        pid = str(project.get("project_id") or "")
         # Skip if issue already created
         if pid and pid in tracker_index:
             if tracker_index[pid].get("github_issue_url"):
                 continue
-        title = f"PFE: {row['title']} — {row['company'] or 'N/A'}"
-        body = render_issue(row.to_dict())
+        title = f"PFE: {project['title']} — {project['company'] or 'N/A'}"
+        body = render_issue(project)
         payload = {"title": title, "body": body}
         try:
-            resp = requests.post(base_url, json=payload, headers=headers, timeout=15)
+            resp = session.post(base_url, json=payload, timeout=15)
             if resp.status_code >= 400:
                 logging.warning("GitHub API error %s: %s", resp.status_code, resp.text)
             else:
@@ -314,6 +315,12 @@ def save_aggregated_csv(df: pd.DataFrame, force: bool = False) -> Path:
     if path.exists() and not force:
         logging.info("aggregated_projects.csv already exists; use --force to overwrite.")
         return path
+    if pa_csv is not None:
+        try:
+            pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), str(path))
+            return path
+        except Exception as exc:  # pragma: no cover - depends on dtypes
+            logging.warning("pyarrow CSV write failed (%s); falling back to pandas.", exc)
     df.to_csv(path, index=False)
     return path
 
@@ -321,25 +328,29 @@ def save_aggregated_csv(df: pd.DataFrame, force: bool = False) -> Path:
 def update_tracker(df: pd.DataFrame) -> None:
     ensure_tracker_exists()
     now = dt.datetime.utcnow().isoformat()
-    for _, row in df.iterrows():
-        append_tracker_row(
+    rows: List[Dict[str, Any]] = []
+    for row in df.itertuples(index=False):
+        project = row._asdict()
+        rows.append(
             {
                 "date_added": now,
-                "project_id": row.get("project_id", ""),
-                "title": row.get("title", ""),
-                "company": row.get("company", ""),
-                "fitness": row.get("fitness", ""),
-                "pfe_link": row.get("link", ""),
-                "contact_email": row.get("contact_email", ""),
+                "project_id": project.get("project_id", ""),
+                "title": project.get("title", ""),
+                "company": project.get("company", ""),
+                "fitness": project.get("fitness", ""),
+                "pfe_link": project.get("link", ""),
+                "contact_email": project.get("contact_email", ""),
                 "posted_telegram": "",
                 "github_issue_url": "",
                 "email_draft": "",
                 "last_action": now,
                 "status": "new",
                 "notes": "fitness_match_approx="
-                + ("True" if row.get("fitness_match_approx") else "False"),
+                + ("True" if project.get("fitness_match_approx") else "False"),
             }
         )
+    # One transaction for the whole batch instead of one commit per project.
+    append_tracker_rows(rows)
 
 
 def main(argv: Optional[List[str]] = None) -> int:
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import datetime as dt
 import logging
+import os
 import re
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List
 
 try:
     import pdfplumber  # type: ignore
@@ -20,29 +22,79 @@ except Exception:  # pragma: no cover - optional
 
 
 KEYWORDS = ["pfe", "projet", "stage"]
+# Single compiled pattern so the keyword check is one C-level scan per
+# line instead of a .lower() copy plus one substring scan per keyword.
+_KEYWORDS_RE = re.compile("|".join(KEYWORDS), re.IGNORECASE)
+
+
+def _extract_page_pdfplumber(path_str: str, index: int) -> str:
+    """Extract text from a single page; runs in a worker process."""
+
+    with pdfplumber.open(path_str) as pdf:  # type: ignore[union-attr]
+        return pdf.pages[index].extract_text() or ""
+
+
+def _extract_page_pypdf2(path_str: str, index: int) -> str:
+    """Extract text from a single page with PyPDF2; runs in a worker process."""
+
+    reader = PdfReader(path_str)  # type: ignore[misc]
+    return reader.pages[index].extract_text() or ""
+
+
+def _extract_pages_parallel(worker: Callable[[str, int], str], path: Path, num_pages: int) -> str:
+    """Extract all pages, fanning out across processes for multi-page PDFs.
+
+    Page extraction is CPU-bound, so a process pool gives near-linear
+    scaling with core count on large catalogues. Single-page PDFs are
+    handled inline to avoid pool startup cost.
+    """
+
+    if num_pages <= 1:
+        return worker(str(path), 0) if num_pages == 1 else ""
+
+    max_workers = min(os.cpu_count() or 1, num_pages)
+    if max_workers <= 1:
+        return "\n".join(worker(str(path), i) for i in range(num_pages))
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        texts = list(executor.map(worker, [str(path)] * num_pages, range(num_pages)))
+    return "\n".join(texts)
+
+
+# Below roughly this many extracted characters per page, the fast
+# backend probably hit a scanned or layout-heavy PDF and pdfplumber's
+# full layout analysis is worth its cost.
+_MIN_CHARS_PER_PAGE = 100
 
 
 def _read_pdf_text(path: Path) -> str:
-    """Read all text from PDF using pdfplumber, falling back to PyPDF2."""
+    """Read all text from a PDF, trying the fastest backend first.
+
+    PyPDF2 extracts plain text several times faster than pdfplumber,
+    which builds a full layout tree we do not need for text-only PDFs.
+    Escalate to pdfplumber only when the PyPDF2 output looks too thin
+    for the page count.
+    """
 
     text = ""
-    if pdfplumber is not None:
+    num_pages = 0
+    if PdfReader is not None:
         try:
-            with pdfplumber.open(str(path)) as pdf:  # type: ignore[arg-type]
-                for page in pdf.pages:
-                    page_text = page.extract_text() or ""
-                    text += "\n" + page_text
+            reader = PdfReader(str(path))  # type: ignore[call-arg]
+            num_pages = len(reader.pages)
+            text = _extract_pages_parallel(_extract_page_pypdf2, path, num_pages)
         except Exception as exc:  # pragma: no cover
-            logging.warning("pdfplumber failed for %s: %s", path, exc)
+            logging.warning("PyPDF2 failed for %s: %s", path, exc)
 
-    if not text and PdfReader is not None:
+    if pdfplumber is not None and len(text.strip()) < _MIN_CHARS_PER_PAGE * max(num_pages, 1):
         try:
-            reader = PdfReader(str(path))  # type: ignore[call-arg]
-            for page in reader.pages:
-                page_text = page.extract_text() or ""
-                text += "\n" + page_text
+            with pdfplumber.open(str(path)) as pdf:  # type: ignore[arg-type]
+                num_pages = len(pdf.pages)
+            plumber_text = _extract_pages_parallel(_extract_page_pdfplumber, path, num_pages)
+            if len(plumber_text.strip()) > len(text.strip()):
+                text = plumber_text
         except Exception as exc:  # pragma: no cover
-            logging.warning("PyPDF2 failed for %s: %s", path, exc)
+            logging.warning("pdfplumber failed for %s: %s", path, exc)
 
     return text
 
@@ -90,8 +142,7 @@ def extract_pfe_entries_from_pdf(path: Path) -> List[Dict[str, Any]]:
         buf = []
 
     for line in lines:
-        low = line.lower()
-        if any(k in low for k in KEYWORDS):
+        if _KEYWORDS_RE.search(line):
             buf.append(line)
         else:
             flush()
@@ -10,22 +10,31 @@ state file under data/ so it only announces new books and sends a
 from __future__ import annotations
 
 import argparse
+import asyncio
 import datetime as dt
 import json
 import logging
 import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
-import requests
+import aiohttp
 from bs4 import BeautifulSoup
 
+from .scrapers import make_client_session
 from .utils import DATA_DIR, load_env
 
-USER_AGENT = "PFE-AggregatorBot/1.0 (+https://github.com/korbirayen/PFE-Helper)"
 BASE_CATALOGUE_URL = "https://pfebooks.com/catalogue/"
 STATE_FILE = DATA_DIR / "pfebooks_state.json"
+SEEN_URLS_FILE = DATA_DIR / "pfebooks_seen_urls.ndjson"
+
+try:  # lxml's C parser is much faster than the pure-Python html.parser
+    import lxml  # type: ignore # noqa: F401
+
+    _BS_PARSER = "lxml"
+except Exception:  # pragma: no cover - optional dependency handling
+    _BS_PARSER = "html.parser"
 
 
 @dataclass
@@ -35,135 +44,211 @@ class BookEntry:
     published_at: Optional[dt.datetime]
 
 
-def _fetch(url: str, timeout: int = 15) -> Optional[requests.Response]:
-    headers = {"User-Agent": USER_AGENT}
+async def _fetch_async(session: aiohttp.ClientSession, url: str, timeout: int = 15) -> Optional[str]:
     try:
-        resp = requests.get(url, headers=headers, timeout=timeout)
-        if resp.status_code >= 400:
-            logging.warning("HTTP %s for %s", resp.status_code, url)
-            return None
-        return resp
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as resp:
+            if resp.status >= 400:
+                logging.warning("HTTP %s for %s", resp.status, url)
+                return None
+            return await resp.text()
     except Exception as exc:  # pragma: no cover - network dependent
         logging.warning("Error fetching %s: %s", url, exc)
         return None
 
 
-def parse_book_page(url: str) -> Optional[dt.datetime]:
-    """Try to parse publish date from a pfebooks book page.
+def _parse_iso_date(value: str) -> Optional[dt.datetime]:
+    try:
+        return dt.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except Exception:
+        return None
+
+
+def _parse_text_date(value: str) -> Optional[dt.datetime]:
+    for fmt in ("%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y"):
+        try:
+            return dt.datetime.strptime(value, fmt)
+        except Exception:
+            continue
+    return None
+
+
+def _parse_publish_date(html: str) -> Optional[dt.datetime]:
+    """Try to parse a publish date out of a pfebooks book page's HTML.
 
-    We try several strategies:
+    We try several strategies, in order:
     - <meta property="article:published_time" ...>
     - <time datetime="..."> or <time>text</time>
     - JSON-LD with datePublished.
     Returns None if no date could be parsed.
     """
 
-    resp = _fetch(url)
-    if not resp:
-        return None
-    soup = BeautifulSoup(resp.text, "html.parser")
+    soup = BeautifulSoup(html, _BS_PARSER)
+
+    # Collect candidate strings in priority order, then parse once below.
+    candidates: List[Optional[dt.datetime]] = []
 
-    # Strategy 1: meta property
     meta = soup.find("meta", attrs={"property": "article:published_time"})
     if meta and meta.get("content"):
-        try:
-            return dt.datetime.fromisoformat(meta["content"].replace("Z", "+00:00"))
-        except Exception:
-            pass
+        candidates.append(_parse_iso_date(meta["content"]))
 
-    # Strategy 2: <time datetime="...">
     t = soup.find("time", attrs={"datetime": True})
     if t is not None:
-        try:
-            return dt.datetime.fromisoformat(t["datetime"].replace("Z", "+00:00"))
-        except Exception:
-            pass
+        candidates.append(_parse_iso_date(t["datetime"]))
 
-    # Strategy 3: <time>text</time>
     t = soup.find("time")
     if t and t.text.strip():
-        txt = t.text.strip()
-        for fmt in ("%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y"):
-            try:
-                return dt.datetime.strptime(txt, fmt)
-            except Exception:
-                continue
+        candidates.append(_parse_text_date(t.text.strip()))
 
-    # Strategy 4: JSON-LD
     for script in soup.find_all("script", type="application/ld+json"):
         try:
             data = json.loads(script.string or "{}")
         except Exception:
             continue
         if isinstance(data, dict) and "datePublished" in data:
-            try:
-                return dt.datetime.fromisoformat(str(data["datePublished"]).replace("Z", "+00:00"))
-            except Exception:
-                continue
+            candidates.append(_parse_iso_date(str(data["datePublished"])))
 
+    for parsed in candidates:
+        if parsed is not None:
+            return parsed
     return None
 
 
-def scrape_catalogue(max_pages: int = 10) -> List[BookEntry]:
-    """Scrape the catalogue index pages and return book entries.
+async def parse_book_page_async(session: aiohttp.ClientSession, url: str) -> Optional[dt.datetime]:
+    """Fetch a book page and parse its publish date (async)."""
+
+    html = await _fetch_async(session, url)
+    if not html:
+        return None
+    return _parse_publish_date(html)
+
+
+async def _enrich_entries(session: aiohttp.ClientSession, entries: List[BookEntry]) -> None:
+    """Fill publish dates for all entries, with bounded concurrency."""
+
+    sem = asyncio.Semaphore(20)
+
+    async def bounded(entry: BookEntry) -> None:
+        async with sem:
+            entry.published_at = await parse_book_page_async(session, entry.url)
+
+    await asyncio.gather(*(bounded(e) for e in entries))
 
-    Pagination is done via /catalogue/page/2/, /page/3/, ... until
-    no book links are found or max_pages is reached.
-    """
+
+def _catalogue_page_url(page: int) -> str:
+    return BASE_CATALOGUE_URL if page == 1 else f"{BASE_CATALOGUE_URL}page/{page}/"
+
+
+async def _scrape_catalogue_async(session: aiohttp.ClientSession, max_pages: int = 10) -> List[BookEntry]:
+    # Speculatively fetch all index pages in parallel instead of waiting
+    # for page N to parse before requesting N+1; a few wasted requests
+    # past the last page are cheaper than max_pages serial round-trips.
+    logging.info("Scraping catalogue pages 1..%s", max_pages)
+    pages_html = await asyncio.gather(
+        *(_fetch_async(session, _catalogue_page_url(i)) for i in range(1, max_pages + 1)),
+        return_exceptions=True,
+    )
 
     entries: List[BookEntry] = []
-    page = 1
-    while page <= max_pages:
-        url = BASE_CATALOGUE_URL if page == 1 else f"{BASE_CATALOGUE_URL}page/{page}/"
-        logging.info("Scraping catalogue page %s: %s", page, url)
-        resp = _fetch(url)
-        if not resp:
+    seen_urls: set[str] = set()
+    seen_titles: set[str] = set()
+    for page, html in enumerate(pages_html, start=1):
+        if isinstance(html, BaseException):
+            logging.warning("Error fetching catalogue page %s: %s", page, html)
             break
-        soup = BeautifulSoup(resp.text, "html.parser")
+        if not html:
+            break
+        soup = BeautifulSoup(html, _BS_PARSER)
 
-        # Heuristic: links under main content that look like catalogue items
+        # Heuristic: links under main content that look like catalogue
+        # items; the attribute selector filters inside the C selector
+        # engine instead of scanning every anchor in Python.
         page_entries = []
-        for a in soup.find_all("a", href=True):
+        for a in soup.select('a[href*="/catalogue/202"]'):
             href = a["href"]
-            if "/catalogue/202" not in href:
-                continue
             title = a.get_text(strip=True)
             if not title:
                 continue
-            # Avoid duplicates within page
-            if any(e.url == href for e in entries) or any(e.url == href for e in page_entries):
+            # Avoid duplicate URLs and titles across all pages; set
+            # membership keeps this O(1) as the catalogue grows.
+            if href in seen_urls or title.lower() in seen_titles:
                 continue
+            seen_urls.add(href)
+            seen_titles.add(title.lower())
             page_entries.append(BookEntry(title=title, url=href, published_at=None))
 
         if not page_entries:
             break
 
-        # Enrich with publish dates
-        for e in page_entries:
-            e.published_at = parse_book_page(e.url)
-            entries.append(e)
+        entries.extend(page_entries)
 
-        page += 1
+    # Enrich with publish dates concurrently; one serial GET per book
+    # page was the dominant cost on large catalogues.
+    await _enrich_entries(session, entries)
 
     return entries
 
 
-def load_state() -> dict:
-    if not STATE_FILE.exists():
-        return {"seen_urls": [], "last_run": None}
-    try:
-        return json.loads(STATE_FILE.read_text(encoding="utf-8"))
-    except Exception:
-        return {"seen_urls": [], "last_run": None}
+def scrape_catalogue(max_pages: int = 10) -> List[BookEntry]:
+    """Scrape the catalogue index pages and return book entries.
+
+    Pagination is done via /catalogue/page/2/, /page/3/, ... until
+    no book links are found or max_pages is reached. Book pages are
+    fetched concurrently through one shared aiohttp session.
+    """
+
+    async def run() -> List[BookEntry]:
+        async with make_client_session() as session:
+            return await _scrape_catalogue_async(session, max_pages)
+
+    return asyncio.run(run())
+
+
+def load_seen_urls() -> set[str]:
+    """Load the set of already-announced book URLs.
+
+    Seen URLs live in an append-only file with one URL per line, so each
+    run only writes the new entries instead of rewriting the whole state.
+    A legacy pfebooks_state.json is migrated on first load.
+    """
 
+    if SEEN_URLS_FILE.exists():
+        return {line for line in SEEN_URLS_FILE.read_text(encoding="utf-8").splitlines() if line}
+
+    # One-time migration from the legacy JSON state file
+    if STATE_FILE.exists():
+        try:
+            state = json.loads(STATE_FILE.read_text(encoding="utf-8"))
+        except Exception:
+            return set()
+        urls = {u for u in state.get("seen_urls", []) if u}
+        if urls:
+            append_seen_urls(sorted(urls))
+        return urls
+
+    return set()
+
+
+def append_seen_urls(urls: Iterable[str]) -> None:
+    """Append newly-seen URLs to the state file (O(new), not O(all))."""
+
+    SEEN_URLS_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with SEEN_URLS_FILE.open("a", encoding="utf-8") as f:
+        f.writelines(f"{u}\n" for u in urls)
+
+
+def save_last_run() -> None:
+    """Record the last run timestamp, replacing the file atomically."""
 
-def save_state(state: dict) -> None:
     STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
-    state["last_run"] = dt.datetime.utcnow().isoformat()
-    STATE_FILE.write_text(json.dumps(state, indent=2), encoding="utf-8")
+    tmp = STATE_FILE.with_suffix(".json.tmp")
+    tmp.write_text(
+        json.dumps({"last_run": dt.datetime.utcnow().isoformat()}, indent=2),
+        encoding="utf-8",
+    )
+    os.replace(tmp, STATE_FILE)
 
 
-def post_telegram_message(text: str) -> bool:
+async def post_telegram_message(session: aiohttp.ClientSession, text: str) -> bool:
     token = os.getenv("TELEGRAM_BOT_TOKEN")
     chat_id = os.getenv("TELEGRAM_CHAT_ID")
     if not token or not chat_id:
@@ -173,25 +258,24 @@ def post_telegram_message(text: str) -> bool:
     url = f"https://api.telegram.org/bot{token}/sendMessage"
     payload = {"chat_id": chat_id, "text": text}
     try:
-        resp = requests.post(url, json=payload, timeout=15)
-        if resp.status_code >= 400:
-            logging.warning("Telegram API error %s: %s", resp.status_code, resp.text)
-            return False
-        return True
+        async with session.post(url, json=payload, timeout=aiohttp.ClientTimeout(total=15)) as resp:
+            if resp.status >= 400:
+                logging.warning("Telegram API error %s: %s", resp.status, await resp.text())
+                return False
+            return True
     except Exception as exc:  # pragma: no cover
         logging.warning("Error posting to Telegram: %s", exc)
         return False
 
 
-def notify(window_days: int = 5) -> None:
+async def _notify_async(session: aiohttp.ClientSession, window_days: int = 5) -> None:
     # Work with naive UTC datetimes for comparisons
     now = dt.datetime.utcnow()
     since = now - dt.timedelta(days=window_days)
 
-    state = load_state()
-    seen_urls = set(state.get("seen_urls", []))
+    seen_urls = load_seen_urls()
 
-    entries = scrape_catalogue()
+    entries = await _scrape_catalogue_async(session)
     logging.info("Scraped %d catalogue entries", len(entries))
 
     # Filter by publish date window
@@ -216,10 +300,11 @@ def notify(window_days: int = 5) -> None:
 
     if not new_entries:
         logging.info("No new PFE Books found; sending 'Nothing new'.")
-        post_telegram_message("PFEBooks catalogue: Nothing new in the last 5 days.")
-        save_state({"seen_urls": list(seen_urls)})
+        await post_telegram_message(session, "PFEBooks catalogue: Nothing new in the last 5 days.")
+        save_last_run()
         return
 
+    announced: List[str] = []
     for e in new_entries:
         published_str = e.published_at.strftime("%Y-%m-%d") if e.published_at else "unknown date"
         msg = (
@@ -227,10 +312,26 @@ def notify(window_days: int = 5) -> None:
             f"Date: {published_str}\n"
             f"Link: {e.url}"
         )
-        post_telegram_message(msg)
-        seen_urls.add(e.url)
+        await post_telegram_message(session, msg)
+        announced.append(e.url)
+
+    append_seen_urls(announced)
+    save_last_run()
+
+
+def notify(window_days: int = 5) -> None:
+    """Run the full notifier with one shared HTTP session.
+
+    Catalogue scraping, book-page enrichment and Telegram posting all go
+    through a single tuned session so DNS answers and connections are
+    reused across the run.
+    """
+
+    async def run() -> None:
+        async with make_client_session() as session:
+            await _notify_async(session, window_days)
 
-    save_state({"seen_urls": list(seen_urls)})
+    asyncio.run(run())
 
 
 def build_arg_parser() -> argparse.ArgumentParser:
@@ -6,23 +6,73 @@ Each scraper returns a list of project dicts with keys:
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import concurrent.futures
 import datetime as dt
+import functools
+import hashlib
+import json
 import logging
+import os
+import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlparse
 
+import aiohttp
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from lxml import etree
+from lxml import html as lxml_html
+from selectolax.parser import HTMLParser
 
 from .utils import DATA_DIR
 
+try:  # AsyncResolver needs the optional aiodns package
+    from aiohttp.resolver import AsyncResolver  # type: ignore
+except Exception:  # pragma: no cover - optional dependency handling
+    AsyncResolver = None  # type: ignore
+
 
 USER_AGENT = "PFE-AggregatorBot/1.0 (+https://github.com/yourusername/pfe-helper)"
 
+# Shared session for the sync fetch path: keep-alive and connection
+# pooling spare a fresh TCP+TLS handshake per request.
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": USER_AGENT})
+_ADAPTER = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+
+
+def make_client_session() -> aiohttp.ClientSession:
+    """Build an aiohttp session with a tuned connector for scraping runs.
 
-@dataclass
+    DNS answers are cached for 5 minutes and per-host connections are
+    capped at 4 so a large fan-out cannot hammer a single site; the
+    overall limit of 100 is where extra concurrency stops paying off.
+    Falls back to the default resolver when aiodns is not installed.
+    """
+
+    resolver = None
+    if AsyncResolver is not None:
+        try:
+            resolver = AsyncResolver(nameservers=["1.1.1.1", "8.8.8.8"])
+        except Exception:  # pragma: no cover - aiodns missing at runtime
+            resolver = None
+    connector = aiohttp.TCPConnector(
+        limit=100,
+        limit_per_host=4,
+        ttl_dns_cache=300,
+        resolver=resolver,
+    )
+    return aiohttp.ClientSession(connector=connector, headers={"User-Agent": USER_AGENT})
+
+
+@dataclass(slots=True, frozen=True)
 class ScrapeResult:
     title: str
     company: str
@@ -44,26 +94,161 @@ class ScrapeResult:
         }
 
 
+# Link-status lines are buffered in memory and flushed once at process
+# exit: a scrape run with many broken links would otherwise pay an
+# open/stat/write cycle per failed URL.
+_LINK_LOG_PATH = DATA_DIR / "link_statuses.csv"
+_LINK_LOG_BUFFER: List[str] = []
+_LINK_LOG_LOCK = threading.Lock()
+
+
 def _log_link_status(url: str, status: str, message: str = "") -> None:
-    path = DATA_DIR / "link_statuses.csv"
-    new = not path.exists()
-    with path.open("a", encoding="utf-8", newline="") as f:
+    ts = dt.datetime.utcnow().isoformat()
+    safe_msg = message.replace("\n", " ").replace("\r", " ")
+    with _LINK_LOG_LOCK:
+        _LINK_LOG_BUFFER.append(f"{ts},{url},{status},{safe_msg}\n")
+
+
+def _flush_link_log() -> None:
+    with _LINK_LOG_LOCK:
+        lines = list(_LINK_LOG_BUFFER)
+        _LINK_LOG_BUFFER.clear()
+    if not lines:
+        return
+    new = not _LINK_LOG_PATH.exists()
+    with _LINK_LOG_PATH.open("a", encoding="utf-8", newline="") as f:
         if new:
             f.write("timestamp,url,status,message\n")
-        ts = dt.datetime.utcnow().isoformat()
-        safe_msg = message.replace("\n", " ").replace("\r", " ")
-        f.write(f"{ts},{url},{status},{safe_msg}\n")
+        f.write("".join(lines))
+
+
+atexit.register(_flush_link_log)
+
+
+# Minimum spacing between requests to the same host, in seconds.
+# Running faster than a site tolerates turns into dropped connections
+# and retries that cost more wall-clock than the pacing does.
+_MIN_INTERVAL = {
+    "pfebook.com": 2.0,
+    "pfebooks.com": 2.0,
+    "hi-interns.com": 1.0,
+    "itgate-group.com": 1.5,
+    "rh.medianet.tn": 2.0,
+    "_default": 0.5,
+}
+_LAST_HIT: Dict[str, float] = {}
+_RATE_LOCK = threading.Lock()
+
+
+def _respect_rate_limit(url: str) -> None:
+    """Sleep just long enough to keep per-host request spacing."""
+
+    host = urlparse(url).netloc.lower().removeprefix("www.")
+    interval = _MIN_INTERVAL.get(host, _MIN_INTERVAL["_default"])
+    with _RATE_LOCK:
+        sleep_for = max(0.0, _LAST_HIT.get(host, 0.0) + interval - time.monotonic())
+        # Reserve the slot before sleeping so concurrent callers space out
+        _LAST_HIT[host] = time.monotonic() + sleep_for
+    if sleep_for > 0:
+        time.sleep(sleep_for)
+
+
+# HTTP validator cache for conditional GETs: nightly runs refetch the
+# same pages verbatim, and a 304 Not Modified spares both the transfer
+# and the downstream parse. Validators live in data/http_cache.json,
+# bodies as hash-named files under data/http_cache/.
+_HTTP_CACHE_PATH = DATA_DIR / "http_cache.json"
+_HTTP_CACHE_BODY_DIR = DATA_DIR / "http_cache"
+_HTTP_CACHE: Optional[Dict[str, Dict[str, str]]] = None
+_HTTP_CACHE_DIRTY = False
+_HTTP_CACHE_LOCK = threading.Lock()
+
+
+def _http_cache() -> Dict[str, Dict[str, str]]:
+    global _HTTP_CACHE
+    if _HTTP_CACHE is None:
+        try:
+            _HTTP_CACHE = json.loads(_HTTP_CACHE_PATH.read_text(encoding="utf-8"))
+        except Exception:
+            _HTTP_CACHE = {}
+    return _HTTP_CACHE
+
+
+def _read_cached_body(entry: Dict[str, str]) -> Optional[bytes]:
+    try:
+        return Path(entry["body_path"]).read_bytes()
+    except Exception:
+        return None
+
+
+def _store_http_cache(url: str, resp_headers: Any, body: bytes) -> None:
+    etag = resp_headers.get("ETag", "")
+    last_modified = resp_headers.get("Last-Modified", "")
+    if not etag and not last_modified:
+        return
+    _HTTP_CACHE_BODY_DIR.mkdir(parents=True, exist_ok=True)
+    body_path = _HTTP_CACHE_BODY_DIR / (hashlib.sha1(url.encode("utf-8")).hexdigest() + ".html")
+    body_path.write_bytes(body)
+    global _HTTP_CACHE_DIRTY
+    with _HTTP_CACHE_LOCK:
+        _http_cache()[url] = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "body_path": str(body_path),
+        }
+        _HTTP_CACHE_DIRTY = True
+
 
+def _flush_http_cache() -> None:
+    global _HTTP_CACHE_DIRTY
+    with _HTTP_CACHE_LOCK:
+        if not _HTTP_CACHE_DIRTY or _HTTP_CACHE is None:
+            return
+        payload = json.dumps(_HTTP_CACHE, indent=2)
+        _HTTP_CACHE_DIRTY = False
+    tmp = _HTTP_CACHE_PATH.with_suffix(".json.tmp")
+    tmp.write_text(payload, encoding="utf-8")
+    os.replace(tmp, _HTTP_CACHE_PATH)
+
+
+atexit.register(_flush_http_cache)
+
+
+def _conditional_headers(cached: Optional[Dict[str, str]]) -> Dict[str, str]:
+    headers: Dict[str, str] = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+    return headers
+
+
+def _fetch(url: str, timeout: int = 15) -> Optional[bytes]:
+    """Fetch a URL body, retrying once and honouring HTTP validators.
+
+    Sends If-None-Match / If-Modified-Since from the cache; a 304 answer
+    is served from the stored body without re-downloading.
+    """
+
+    cached = _http_cache().get(url)
+    headers = _conditional_headers(cached)
 
-def _fetch(url: str, timeout: int = 15) -> Optional[requests.Response]:
-    headers = {"User-Agent": USER_AGENT}
     for attempt in range(2):  # retry once
         try:
-            resp = requests.get(url, headers=headers, timeout=timeout)
+            _respect_rate_limit(url)
+            resp = _SESSION.get(url, timeout=timeout, headers=headers or None)
+            if resp.status_code == 304 and cached is not None:
+                body = _read_cached_body(cached)
+                if body is not None:
+                    return body
+                # Cached body went missing; refetch unconditionally.
+                resp = _SESSION.get(url, timeout=timeout)
             if resp.status_code >= 400:
                 _log_link_status(url, f"HTTP_{resp.status_code}")
                 return None
-            return resp
+            _store_http_cache(url, resp.headers, resp.content)
+            return resp.content
         except Exception as exc:  # pragma: no cover - depends on network
             logging.warning("Error fetching %s on attempt %s: %s", url, attempt + 1, exc)
             if attempt == 0:
@@ -74,24 +259,40 @@ def _fetch(url: str, timeout: int = 15) -> Optional[requests.Response]:
     return None
 
 
-def _scrape_pfebook(url: str) -> List[ScrapeResult]:
-    resp = _fetch(url)
-    if not resp:
-        return []
-    soup = BeautifulSoup(resp.text, "html.parser")
+# Card selectors shared between parsers and kept in one place so a site
+# redesign is a one-line fix.
+_SEL_PFEBOOK_CARDS = ".job-card, .card, article"
+_SEL_HI_INTERNS_CARDS = ".internship-card, .card, article"
+_SEL_ITGATE_ITEMS = "li, .pfe-item, article"
+_SEL_MEDIANET_CARDS = ".job-offer, .card, article"
+
+
+@functools.lru_cache(maxsize=64)
+def _tree_for(html: str | bytes) -> HTMLParser:
+    """Parse a body once and reuse the tree across parser calls.
+
+    Keyed by the body itself, so fallback chains (site parser first, then
+    generic on the same page) and repeated URLs within a run never pay
+    the parse cost twice.
+    """
+
+    return HTMLParser(html)
+
+
+def _parse_pfebook(html: str | bytes, url: str, date: str) -> List[ScrapeResult]:
+    tree = _tree_for(html)
     items: List[ScrapeResult] = []
-    date = dt.datetime.utcnow().date().isoformat()
 
     # pfebook.com structure may change; here we try generic card/listing patterns
-    for card in soup.select(".job-card, .card, article"):
-        title_el = card.select_one("h2, h3, .job-title")
-        title = title_el.get_text(strip=True) if title_el else "PFE opportunity"
-        company_el = card.select_one(".company, .company-name, .job-company")
-        company = company_el.get_text(strip=True) if company_el else ""
-        desc_el = card.select_one(".description, .job-description, p")
-        description = desc_el.get_text(" ", strip=True) if desc_el else ""
-        link_el = card.select_one("a")
-        href = link_el["href"] if link_el and link_el.has_attr("href") else url
+    for card in tree.css(_SEL_PFEBOOK_CARDS):
+        title_el = card.css_first("h2, h3, .job-title")
+        title = title_el.text(strip=True) if title_el else "PFE opportunity"
+        company_el = card.css_first(".company, .company-name, .job-company")
+        company = company_el.text(strip=True) if company_el else ""
+        desc_el = card.css_first(".description, .job-description, p")
+        description = desc_el.text(separator=" ", strip=True) if desc_el else ""
+        link_el = card.css_first("a")
+        href = (link_el.attributes.get("href") if link_el else None) or url
         if href.startswith("/"):
             href = url.rstrip("/") + href
         email = ""
@@ -109,23 +310,19 @@ def _scrape_pfebook(url: str) -> List[ScrapeResult]:
     return items
 
 
-def _scrape_hi_interns(url: str) -> List[ScrapeResult]:
-    resp = _fetch(url)
-    if not resp:
-        return []
-    soup = BeautifulSoup(resp.text, "html.parser")
+def _parse_hi_interns(html: str | bytes, url: str, date: str) -> List[ScrapeResult]:
+    tree = _tree_for(html)
     items: List[ScrapeResult] = []
-    date = dt.datetime.utcnow().date().isoformat()
-
-    for card in soup.select(".internship-card, .card, article"):
-        title_el = card.select_one("h2, h3, .title")
-        title = title_el.get_text(strip=True) if title_el else "Internship / PFE"
-        company_el = card.select_one(".company, .company-name")
-        company = company_el.get_text(strip=True) if company_el else ""
-        desc_el = card.select_one(".description, p")
-        description = desc_el.get_text(" ", strip=True) if desc_el else ""
-        link_el = card.select_one("a")
-        href = link_el["href"] if link_el and link_el.has_attr("href") else url
+
+    for card in tree.css(_SEL_HI_INTERNS_CARDS):
+        title_el = card.css_first("h2, h3, .title")
+        title = title_el.text(strip=True) if title_el else "Internship / PFE"
+        company_el = card.css_first(".company, .company-name")
+        company = company_el.text(strip=True) if company_el else ""
+        desc_el = card.css_first(".description, p")
+        description = desc_el.text(separator=" ", strip=True) if desc_el else ""
+        link_el = card.css_first("a")
+        href = (link_el.attributes.get("href") if link_el else None) or url
         if href.startswith("/"):
             href = url.rstrip("/") + href
         items.append(
@@ -142,22 +339,18 @@ def _scrape_hi_interns(url: str) -> List[ScrapeResult]:
     return items
 
 
-def _scrape_itgate(url: str) -> List[ScrapeResult]:
-    resp = _fetch(url)
-    if not resp:
-        return []
-    soup = BeautifulSoup(resp.text, "html.parser")
+def _parse_itgate(html: str | bytes, url: str, date: str) -> List[ScrapeResult]:
+    tree = _tree_for(html)
     items: List[ScrapeResult] = []
-    date = dt.datetime.utcnow().date().isoformat()
 
-    for li in soup.select("li, .pfe-item, article"):
-        text = li.get_text(" ", strip=True)
+    for li in tree.css(_SEL_ITGATE_ITEMS):
+        text = li.text(separator=" ", strip=True)
         if not text:
             continue
-        title_el = li.select_one("h2, h3")
-        title = title_el.get_text(strip=True) if title_el else text[:120]
-        link_el = li.select_one("a")
-        href = link_el["href"] if link_el and link_el.has_attr("href") else url
+        title_el = li.css_first("h2, h3")
+        title = title_el.text(strip=True) if title_el else text[:120]
+        link_el = li.css_first("a")
+        href = (link_el.attributes.get("href") if link_el else None) or url
         if href.startswith("/"):
             href = url.rstrip("/") + href
         items.append(
@@ -174,21 +367,17 @@ def _scrape_itgate(url: str) -> List[ScrapeResult]:
     return items
 
 
-def _scrape_medianet(url: str) -> List[ScrapeResult]:
-    resp = _fetch(url)
-    if not resp:
-        return []
-    soup = BeautifulSoup(resp.text, "html.parser")
+def _parse_medianet(html: str | bytes, url: str, date: str) -> List[ScrapeResult]:
+    tree = _tree_for(html)
     items: List[ScrapeResult] = []
-    date = dt.datetime.utcnow().date().isoformat()
-
-    for card in soup.select(".job-offer, .card, article"):
-        title_el = card.select_one("h2, h3, .title")
-        title = title_el.get_text(strip=True) if title_el else "Stage PFE"
-        desc_el = card.select_one(".description, p")
-        description = desc_el.get_text(" ", strip=True) if desc_el else ""
-        link_el = card.select_one("a")
-        href = link_el["href"] if link_el and link_el.has_attr("href") else url
+
+    for card in tree.css(_SEL_MEDIANET_CARDS):
+        title_el = card.css_first("h2, h3, .title")
+        title = title_el.text(strip=True) if title_el else "Stage PFE"
+        desc_el = card.css_first(".description, p")
+        description = desc_el.text(separator=" ", strip=True) if desc_el else ""
+        link_el = card.css_first("a")
+        href = (link_el.attributes.get("href") if link_el else None) or url
         if href.startswith("/"):
             href = url.rstrip("/") + href
         items.append(
@@ -205,21 +394,24 @@ def _scrape_medianet(url: str) -> List[ScrapeResult]:
     return items
 
 
-def _scrape_generic(url: str) -> List[ScrapeResult]:
-    resp = _fetch(url)
-    if not resp:
-        return []
-    soup = BeautifulSoup(resp.text, "html.parser")
+# Case-insensitive "anchor text mentions pfe/stage/projet", compiled once
+# and evaluated entirely inside libxml2 instead of one text extraction
+# plus three substring checks per anchor in Python.
+_LOWERCASE_XLATE = "translate(string(.), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+_GENERIC_ANCHOR_XPATH = etree.XPath(
+    "//a[" + " or ".join(f"contains({_LOWERCASE_XLATE}, '{kw}')" for kw in ("pfe", "stage", "projet")) + "]"
+)
+
+
+def _parse_generic(html: str | bytes, url: str, date: str) -> List[ScrapeResult]:
+    doc = lxml_html.fromstring(html)
     items: List[ScrapeResult] = []
-    date = dt.datetime.utcnow().date().isoformat()
 
     # Very generic: each <a> containing 'PFE' or 'stage' is considered a project
-    for a in soup.find_all("a"):
-        text = a.get_text(" ", strip=True)
+    for a in _GENERIC_ANCHOR_XPATH(doc):
+        text = " ".join(a.text_content().split())
         if not text:
             continue
-        if "pfe" not in text.lower() and "stage" not in text.lower() and "projet" not in text.lower():
-            continue
         href = a.get("href") or url
         if href.startswith("/"):
             href = url.rstrip("/") + href
@@ -237,6 +429,23 @@ def _scrape_generic(url: str) -> List[ScrapeResult]:
     return items
 
 
+# Host → parser routing table; registering a new source is one entry.
+_DISPATCH: Dict[str, Callable[[str | bytes, str, str], List[ScrapeResult]]] = {
+    "pfebook.com": _parse_pfebook,
+    "pfebooks.com": _parse_pfebook,
+    "hi-interns.com": _parse_hi_interns,
+    "itgate-group.com": _parse_itgate,
+    "rh.medianet.tn": _parse_medianet,
+}
+
+
+def _parser_for(url: str) -> Callable[[str | bytes, str, str], List[ScrapeResult]]:
+    """Select the per-site parser with an O(1) netloc lookup."""
+
+    host = urlparse(url).netloc.lower().removeprefix("www.")
+    return _DISPATCH.get(host, _parse_generic)
+
+
 def scrape_url(url: str) -> List[Dict[str, Any]]:
     """Dispatch to the appropriate scraper based on the domain.
 
@@ -244,21 +453,124 @@ def scrape_url(url: str) -> List[Dict[str, Any]]:
     """
 
     logging.info("Scraping %s", url)
-    lower = url.lower()
-    if "pfebook.com" in lower or "pfebooks.com" in lower:
-        items = _scrape_pfebook(url)
-    elif "hi-interns.com" in lower:
-        items = _scrape_hi_interns(url)
-    elif "itgate-group.com" in lower:
-        items = _scrape_itgate(url)
-    elif "rh.medianet.tn" in lower:
-        items = _scrape_medianet(url)
-    else:
-        items = _scrape_generic(url)
+    today_iso = dt.datetime.utcnow().date().isoformat()
+    # Raw bytes skip the full-buffer decode of resp.text; selectolax
+    # and lxml both detect the encoding themselves.
+    body = _fetch(url)
+    items = _parser_for(url)(body, url, today_iso) if body else []
 
     logging.info("Found %d potential projects from %s", len(items), url)
     return [it.to_dict() for it in items]
 
 
-__all__ = ["scrape_url"]
+# Cap on simultaneously scraped sources; some remote sites start
+# dropping connections when fanned out against too aggressively.
+_SOURCE_CONCURRENCY = 8
+
+
+def scrape_urls(urls: List[str]) -> List[Dict[str, Any]]:
+    """Scrape several sources in parallel without an event loop.
+
+    Sync fallback to scrape_urls_async for callers that cannot run
+    asyncio. Threads fit here: the work is I/O-bound with a light parse
+    step, and they share the pooled requests session (and its keep-alive
+    connections), which separate processes could not.
+    """
+
+    if not urls:
+        return []
+
+    entries: List[Dict[str, Any]] = []
+    max_workers = min(len(urls), _SOURCE_CONCURRENCY)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as ex:
+        for url, result in zip(urls, ex.map(scrape_url, urls)):
+            entries.extend(result)
+    return entries
+
+
+async def _fetch_async(session: aiohttp.ClientSession, url: str, timeout: int = 15) -> Optional[bytes]:
+    """Async counterpart of _fetch: fetch a URL body, retrying once on failure.
+
+    Returns raw bytes; the parsers detect the encoding themselves, so
+    decoding here would only materialize the page a second time. Shares
+    the HTTP validator cache with _fetch, so the nightly async runs get
+    304 answers for unchanged pages too.
+    """
+
+    cached = _http_cache().get(url)
+    headers = _conditional_headers(cached)
+
+    for attempt in range(2):  # retry once
+        try:
+            async with session.get(
+                url, timeout=aiohttp.ClientTimeout(total=timeout), headers=headers or None
+            ) as resp:
+                if resp.status == 304 and cached is not None:
+                    body = _read_cached_body(cached)
+                    if body is not None:
+                        return body
+                    # Cached body went missing; drop the validators and
+                    # let the retry refetch unconditionally.
+                    cached = None
+                    headers = {}
+                    continue
+                if resp.status >= 400:
+                    _log_link_status(url, f"HTTP_{resp.status}")
+                    return None
+                body = await resp.read()
+                _store_http_cache(url, resp.headers, body)
+                return body
+        except Exception as exc:  # pragma: no cover - depends on network
+            logging.warning("Error fetching %s on attempt %s: %s", url, attempt + 1, exc)
+            if attempt == 0:
+                await asyncio.sleep(2)
+                continue
+            _log_link_status(url, "ERROR", str(exc))
+            return None
+    return None
+
+
+async def scrape_url_async(session: aiohttp.ClientSession, url: str) -> List[Dict[str, Any]]:
+    """Async version of scrape_url, sharing a caller-provided session."""
+
+    logging.info("Scraping %s", url)
+    today_iso = dt.datetime.utcnow().date().isoformat()
+    body = await _fetch_async(session, url)
+    items = _parser_for(url)(body, url, today_iso) if body else []
+
+    logging.info("Found %d potential projects from %s", len(items), url)
+    return [it.to_dict() for it in items]
+
+
+async def scrape_urls_async(urls: List[str]) -> List[Dict[str, Any]]:
+    """Scrape several sources concurrently with one shared aiohttp session.
+
+    Total wall time becomes max(latency) instead of the sum over sources.
+    Concurrency is bounded by a semaphore; exceptions from individual
+    sources are logged and skipped.
+    """
+
+    sem = asyncio.Semaphore(_SOURCE_CONCURRENCY)
+
+    async with make_client_session() as session:
+
+        async def bounded(url: str) -> List[Dict[str, Any]]:
+            async with sem:
+                return await scrape_url_async(session, url)
+
+        results = await asyncio.gather(
+            *(bounded(url) for url in urls),
+            return_exceptions=True,
+        )
+
+    entries: List[Dict[str, Any]] = []
+    for url, result in zip(urls, results):
+        if isinstance(result, BaseException):
+            logging.warning("Error scraping %s: %s", url, result)
+            continue
+        entries.extend(result)
+    return entries
+
+
+__all__ = ["make_client_session", "scrape_url", "scrape_urls", "scrape_url_async", "scrape_urls_async"]
 
@@ -91,19 +91,22 @@ _Generated by PFE Aggregator bot on {{ today }}._
 )
 
 
+# Templates are compiled once at import; rendering is a lookup plus a
+# near-string-format render call, with no per-row template parsing.
+_EMAIL_TEMPLATES: Dict[str, Template] = {
+    "fr": EMAIL_TEMPLATE_FR,
+    "en": EMAIL_TEMPLATE_EN,
+}
+
+
 def render_email(project: Dict[str, Any], my_info: Dict[str, str], language: str = "fr") -> str:
     """Render an email body for a project.
 
     language: "fr" or "en".
     """
 
-    tpl: Template
-    if language.lower().startswith("en"):
-        tpl = EMAIL_TEMPLATE_EN
-    else:
-        tpl = EMAIL_TEMPLATE_FR
-
-    return tpl.render(project=project, **my_info)
+    key = "en" if language.lower().startswith("en") else "fr"
+    return _EMAIL_TEMPLATES[key].render(project=project, **my_info)
 
 
 def render_issue(project: Dict[str, Any]) -> str:
@@ -6,16 +6,18 @@ tracker handling, environment variable loading, and basic CV parsing.
 
 from __future__ import annotations
 
-import csv
 import dataclasses
 import datetime as dt
+import functools
 import logging
 import os
 import re
+import sqlite3
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 from dotenv import load_dotenv
 from slugify import slugify
@@ -30,6 +32,18 @@ try:
 except Exception:  # pragma: no cover - optional dependency handling
     PdfReader = None  # type: ignore
 
+try:  # pypdfium2 wraps PDFium (C++) and extracts text much faster
+    import pypdfium2 as pdfium  # type: ignore
+except Exception:  # pragma: no cover - optional dependency handling
+    pdfium = None  # type: ignore
+
+try:  # rapidfuzz scores fuzzy matches in C++ (SIMD-accelerated)
+    from rapidfuzz import fuzz as rf_fuzz  # type: ignore
+    from rapidfuzz import process as rf_process  # type: ignore
+except Exception:  # pragma: no cover - optional dependency handling
+    rf_fuzz = None  # type: ignore
+    rf_process = None  # type: ignore
+
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
 DATA_DIR = ROOT_DIR / "data"
@@ -116,7 +130,19 @@ def read_companies_csv(path: Optional[Path] = None) -> pd.DataFrame:
         if company_col not in df.columns:
             df[company_col] = ""
 
-    df["__company_norm"] = df[company_col].astype(str).str.strip().str.lower()
+    # fillna first: newer pandas no longer stringifies NaN in astype(str),
+    # so a blank company cell would reach the tokenizer as a float.
+    df["__company_norm"] = df[company_col].fillna("").astype(str).str.strip().str.lower()
+    # Tokenize every CSV company once at load time; match_company_fitness
+    # would otherwise re-tokenize the whole column on every call.
+    df["__tokens"] = df["__company_norm"].map(lambda s: frozenset(_tokenize_company(s)))
+    # Inverted token -> row-position index so the matcher only scores
+    # companies sharing at least one token with the query.
+    token_index: Dict[str, List[int]] = {}
+    for pos, tokens in enumerate(df["__tokens"]):
+        for token in tokens:
+            token_index.setdefault(token, []).append(pos)
+    df.attrs["token_index"] = token_index
     if "Fitness Category" in df.columns:
         df["Fitness Category"] = df["Fitness Category"].astype(str).str.strip()
     else:
@@ -133,16 +159,24 @@ class FitnessMatch:
     approx: bool
 
 
-def _tokenize_company(name: str) -> List[str]:
-    return [t for t in re.split(r"[^a-z0-9]+", name.lower()) if t]
+_TOKEN_RE = re.compile(r"[^a-z0-9]+")
+
+
+@functools.lru_cache(maxsize=8192)
+def _tokenize_company(name: str) -> Tuple[str, ...]:
+    # Returns a tuple so results are hashable and cacheable; repeated
+    # names (common across scrape runs) tokenize only once.
+    return tuple(t for t in _TOKEN_RE.split(name.lower()) if t)
 
 
 def match_company_fitness(company_name: str, companies_df: pd.DataFrame) -> Optional[FitnessMatch]:
     """Return best fitness match for a company using fuzzy token overlap.
 
-    - Performs a simple token-based Jaccard similarity between the given name
-      and each company in the CSV.
-    - Returns None if the CSV is empty or all scores are 0.
+    - When rapidfuzz is installed, scoring runs through its C++
+      token-set ratio (normalized to 0-1); otherwise a pure-Python
+      token-based Jaccard similarity is used.
+    - Either way a match must share at least one token with the query;
+      returns None if the CSV is empty or no candidate overlaps.
     - Marks matches as approximate unless the normalized names are exactly equal.
     """
 
@@ -153,44 +187,96 @@ def match_company_fitness(company_name: str, companies_df: pd.DataFrame) -> Opti
     if not norm:
         return None
 
-    tokens_ref = set(_tokenize_company(norm))
-    if not tokens_ref:
+    ref = frozenset(_tokenize_company(norm))
+    if not ref:
         return None
 
-    best: Tuple[float, int] | None = None
-    best_row: Optional[pd.Series] = None
-
-    for idx, row in companies_df.iterrows():
-        candidate = str(row.get("__company_norm", "")).strip()
-        if not candidate:
-            continue
-        tokens_c = set(_tokenize_company(candidate))
-        if not tokens_c:
-            continue
-        inter = len(tokens_ref & tokens_c)
-        union = len(tokens_ref | tokens_c)
-        score = inter / union if union else 0.0
-        if best is None or score > best[0]:
-            best = (score, idx)
-            best_row = row
-
-    if best is None or best[0] <= 0.0 or best_row is None:
+    if "__tokens" in companies_df.columns:
+        tokens_col = companies_df["__tokens"]
+    else:
+        tokens_col = companies_df["__company_norm"].map(lambda s: frozenset(_tokenize_company(str(s))))
+
+    # Only companies sharing at least one token are match candidates:
+    # this keeps the baseline "unrelated company -> None" semantics (a
+    # character-level ratio alone is almost never zero) and, when the
+    # inverted index is present, shrinks the scoring set too.
+    positions: Optional[List[int]] = None
+    token_index = companies_df.attrs.get("token_index")
+    if token_index is not None:
+        candidates: set = set()
+        for token in ref:
+            candidates.update(token_index.get(token, ()))
+        if not candidates:
+            return None
+        positions = sorted(candidates)
+        tokens_col = tokens_col.iloc[positions]
+
+    if rf_process is not None:
+        choices = companies_df["__company_norm"]
+        if positions is not None:
+            choices = choices.iloc[positions]
+        found = rf_process.extractOne(
+            norm,
+            choices.tolist(),
+            scorer=rf_fuzz.token_set_ratio,
+            score_cutoff=1,
+        )
+        if found is None:
+            return None
+        choice, score, local_idx = found
+        pos = positions[local_idx] if positions is not None else local_idx
+        row = companies_df.iloc[pos]
+        if not (ref & tokens_col.iloc[local_idx]):
+            # No token in common with the best candidate: not a match.
+            return None
+        return FitnessMatch(
+            company_csv=str(choice),
+            fitness=str(row.get("Fitness Category", "")),
+            score=float(score) / 100.0,
+            approx=str(choice) != norm,
+        )
+
+    # Vectorized Jaccard over the precomputed token sets: NumPy does the
+    # arithmetic for the whole column instead of a Python loop per row.
+
+    # Iterate the raw object array rather than .map chains: no
+    # intermediate Series of frozensets/ints gets built per pass.
+    token_sets = tokens_col.to_numpy(dtype=object)
+    n = len(token_sets)
+    inter = np.fromiter((len(ref & s) for s in token_sets), dtype=float, count=n)
+    sizes = np.fromiter((len(s) for s in token_sets), dtype=float, count=n)
+    union = sizes + len(ref) - inter
+    scores = np.divide(inter, union, out=np.zeros_like(inter), where=union > 0)
+
+    if scores.size == 0:
+        return None
+    best_local = int(scores.argmax())
+    if scores[best_local] <= 0.0:
         return None
 
+    best_pos = positions[best_local] if positions is not None else best_local
+    best_row = companies_df.iloc[best_pos]
     approx = best_row.get("__company_norm", "") != norm
     return FitnessMatch(
         company_csv=str(best_row.get("__company_norm", "")),
         fitness=str(best_row.get("Fitness Category", "")),
-        score=float(best[0]),
+        score=float(scores[best_local]),
         approx=approx,
     )
 
 
+@functools.lru_cache(maxsize=4096)
+def _slug80(base: str) -> str:
+    # slugify does Unicode normalization plus regex replacement per call;
+    # the same title/company pairs recur across sources and re-scrapes.
+    return slugify(base)[:80]
+
+
 def make_project_id(title: str, company: str) -> str:
     """Create a stable slug ID from title and company."""
 
     base = f"{title} {company}".strip() or title or company
-    return slugify(base)[:80]
+    return _slug80(base)
 
 
 TRACKER_COLUMNS = [
@@ -210,116 +296,148 @@ TRACKER_COLUMNS = [
 ]
 
 
+# The tracker lives in SQLite: single-row updates were previously a full
+# read + rewrite of tracker.csv, i.e. O(N) IO per field change. A legacy
+# tracker.csv is migrated into the database on first use.
+_TRACKER_SCHEMA = ", ".join(
+    f"{col} TEXT PRIMARY KEY" if col == "project_id" else f"{col} TEXT"
+    for col in TRACKER_COLUMNS
+)
+_TRACKER_INSERT_SQL = (
+    f"INSERT OR REPLACE INTO projects ({', '.join(TRACKER_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in TRACKER_COLUMNS)})"
+)
+
+
 def tracker_path() -> Path:
+    return DATA_DIR / "tracker.sqlite"
+
+
+def _legacy_tracker_csv_path() -> Path:
     return DATA_DIR / "tracker.csv"
 
 
-def ensure_tracker_exists() -> None:
-    path = tracker_path()
-    if path.exists():
+def _migrate_legacy_tracker_csv(conn: sqlite3.Connection) -> None:
+    csv_path = _legacy_tracker_csv_path()
+    if not csv_path.exists():
         return
+    # pandas' C parser reads the whole file in one pass; dtype=str with
+    # keep_default_na=False preserves empty cells as "" instead of NaN.
+    df = pd.read_csv(csv_path, dtype=str, keep_default_na=False)
+    for col in TRACKER_COLUMNS:
+        if col not in df.columns:
+            df[col] = ""
+    rows = df[TRACKER_COLUMNS].values.tolist()
+    if rows:
+        conn.executemany(_TRACKER_INSERT_SQL, rows)
+        conn.commit()
+    logging.info("Migrated %d tracker rows from %s", len(rows), csv_path)
+
+
+def _tracker_conn() -> sqlite3.Connection:
+    """Open the tracker database, creating it (and migrating) if needed."""
+
     ensure_base_dirs()
-    with path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(TRACKER_COLUMNS)
+    first_use = not tracker_path().exists()
+    conn = sqlite3.connect(tracker_path())
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(f"CREATE TABLE IF NOT EXISTS projects ({_TRACKER_SCHEMA})")
+    if first_use:
+        _migrate_legacy_tracker_csv(conn)
+    return conn
+
+
+def ensure_tracker_exists() -> None:
+    _tracker_conn().close()
+
+
+def append_tracker_rows(rows: Iterable[Dict[str, Any]]) -> None:
+    """Insert (or replace) project rows in one transaction.
+
+    Missing columns are filled with ''. Batching through executemany pays
+    the connection and commit cost once per run instead of once per row.
+    """
+
+    params = [[str(row.get(col, "")) for col in TRACKER_COLUMNS] for row in rows]
+    if not params:
+        return
+    conn = _tracker_conn()
+    try:
+        conn.executemany(_TRACKER_INSERT_SQL, params)
+        conn.commit()
+    finally:
+        conn.close()
 
 
 def append_tracker_row(row: Dict[str, Any]) -> None:
-    """Append a row to tracker.csv, filling any missing columns with ''."""
+    """Insert (or replace) a single project row."""
 
-    ensure_tracker_exists()
-    path = tracker_path()
-    ordered = [row.get(col, "") for col in TRACKER_COLUMNS]
-    with path.open("a", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(ordered)
+    append_tracker_rows([row])
 
 
 def update_tracker_status(project_id: str, status: str) -> bool:
-    """Update status of a project in tracker.csv.
+    """Update status of a project in the tracker.
 
     Returns True if a row was updated.
     """
 
-    path = tracker_path()
-    if not path.exists():
-        logging.warning("Tracker file not found at %s", path)
-        return False
-
-    rows: List[Dict[str, str]] = []
-    updated = False
-    with path.open("r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        cols = reader.fieldnames or TRACKER_COLUMNS
-        for r in reader:
-            if r.get("project_id") == project_id:
-                r["status"] = status
-                r["last_action"] = dt.datetime.utcnow().isoformat()
-                updated = True
-            rows.append(r)
-
-    if not updated:
+    if not tracker_path().exists() and not _legacy_tracker_csv_path().exists():
+        logging.warning("Tracker database not found at %s", tracker_path())
         return False
 
-    with path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=cols)
-        writer.writeheader()
-        writer.writerows(rows)
-
-    return True
+    conn = _tracker_conn()
+    try:
+        cur = conn.execute(
+            "UPDATE projects SET status = ?, last_action = ? WHERE project_id = ?",
+            (status, dt.datetime.utcnow().isoformat(), project_id),
+        )
+        conn.commit()
+        return cur.rowcount > 0
+    finally:
+        conn.close()
 
 
 def load_tracker_index() -> Dict[str, Dict[str, str]]:
-    """Load tracker.csv into a dict keyed by project_id.
+    """Load the tracker into a dict keyed by project_id.
 
     Returns an empty dict if the tracker does not exist yet.
     """
 
-    path = tracker_path()
-    if not path.exists():
+    if not tracker_path().exists() and not _legacy_tracker_csv_path().exists():
         return {}
 
-    index: Dict[str, Dict[str, str]] = {}
-    with path.open("r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for r in reader:
-            pid = r.get("project_id") or ""
-            if pid:
-                index[pid] = r
-    return index
+    conn = _tracker_conn()
+    try:
+        rows = conn.execute(f"SELECT {', '.join(TRACKER_COLUMNS)} FROM projects").fetchall()
+    finally:
+        conn.close()
+    return {r["project_id"]: dict(r) for r in rows if r["project_id"]}
 
 
 def update_tracker_field(project_id: str, field: str, value: str) -> bool:
-    """Update a single field for a project in tracker.csv.
+    """Update a single field for a project in the tracker.
 
     Returns True if a row was updated.
     """
 
-    path = tracker_path()
-    if not path.exists():
-        return False
+    if field not in TRACKER_COLUMNS:
+        raise ValueError(f"Unknown tracker column: {field}")
 
-    rows: List[Dict[str, str]] = []
-    updated = False
-    with path.open("r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        cols = reader.fieldnames or TRACKER_COLUMNS
-        for r in reader:
-            if r.get("project_id") == project_id:
-                r[field] = value
-                r["last_action"] = dt.datetime.utcnow().isoformat()
-                updated = True
-            rows.append(r)
-
-    if not updated:
+    if not tracker_path().exists() and not _legacy_tracker_csv_path().exists():
         return False
 
-    with path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=cols)
-        writer.writeheader()
-        writer.writerows(rows)
-
-    return True
+    conn = _tracker_conn()
+    try:
+        cur = conn.execute(
+            f"UPDATE projects SET {field} = ?, last_action = ? WHERE project_id = ?",
+            (value, dt.datetime.utcnow().isoformat(), project_id),
+        )
+        conn.commit()
+        return cur.rowcount > 0
+    finally:
+        conn.close()
 
 
 @dataclass
@@ -333,14 +451,18 @@ class ContactInfo:
         return bool(self.name or self.email or self.phone)
 
 
+_EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+# Very loose Tunisian/international phone pattern
+_PHONE_RE = re.compile(r"\+?\d[\d\s]{7,15}")
+
+
 def _extract_email(text: str) -> Optional[str]:
-    m = re.search(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}", text)
+    m = _EMAIL_RE.search(text)
     return m.group(0) if m else None
 
 
 def _extract_phone(text: str) -> Optional[str]:
-    # Very loose Tunisian/international phone pattern
-    m = re.search(r"\+?\d[\d\s]{7,15}", text)
+    m = _PHONE_RE.search(text)
     return m.group(0).strip() if m else None
 
 
@@ -355,18 +477,33 @@ def parse_cv_contact_info(cv_path: Optional[Path]) -> ContactInfo | None:
         logging.warning("CV PDF not found at %s; email drafts will use placeholders.", cv_path)
         return None
 
-    text = ""
-    try:
-        if pdfplumber is not None:
+    def _page_texts():
+        # pypdfium2 first: PDFium extracts text an order of magnitude
+        # faster than the pure-Python readers for this one-off parse.
+        if pdfium is not None:
+            doc = pdfium.PdfDocument(str(cv_path))
+            try:
+                for page in doc:
+                    yield page.get_textpage().get_text_range() or ""
+            finally:
+                doc.close()
+        elif pdfplumber is not None:
             with pdfplumber.open(str(cv_path)) as pdf:  # type: ignore[arg-type]
                 for page in pdf.pages:
-                    page_text = page.extract_text() or ""
-                    text += "\n" + page_text
+                    yield page.extract_text() or ""
         elif PdfReader is not None:
             reader = PdfReader(str(cv_path))  # type: ignore[call-arg]
             for page in reader.pages:
-                page_text = page.extract_text() or ""
-                text += "\n" + page_text
+                yield page.extract_text() or ""
+
+    text = ""
+    try:
+        for page_text in _page_texts():
+            text += "\n" + page_text
+            # Contact details live on the first page of most CVs; stop
+            # extracting as soon as both an email and a phone matched.
+            if _extract_email(text) and _extract_phone(text):
+                break
     except Exception as exc:  # pragma: no cover - depends on actual file
         logging.warning("Failed to parse CV PDF at %s: %s", cv_path, exc)
         return None
@@ -428,6 +565,7 @@ __all__ = [
     "ContactInfo",
     "ensure_tracker_exists",
     "append_tracker_row",
+    "append_tracker_rows",
     "update_tracker_status",
     "load_tracker_index",
     "update_tracker_field",